@@ -31,6 +31,9 @@ class Config:
     CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
     CACHE_REFRESH_HOUR = int(os.getenv("CACHE_REFRESH_HOUR", "5"))  # 0500 CST
     CACHE_REFRESH_MINUTE = int(os.getenv("CACHE_REFRESH_MINUTE", "0"))
+    CACHE_MEMORY_TTL = int(os.getenv("CACHE_MEMORY_TTL", "60"))  # seconds
+    # Opt-in: serve the previous snapshot while a stale cache rebuilds in the background
+    CACHE_BACKGROUND_REFRESH = os.getenv("CACHE_BACKGROUND_REFRESH", "False").lower() == "true"
 
     # --- Attendance Colors ---
     ATT_COLOR_PRESENT = os.getenv("ATT_COLOR_PRESENT", "#00ff00")
@@ -9,13 +9,15 @@ the caching layer and directly by the writer blueprint.
 
 from __future__ import annotations
 
-import io
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date as _date
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -23,9 +25,11 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import gspread
 import pandas as pd
 import requests
-from gspread.cell import Cell
+from gspread.exceptions import APIError
 from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 log = logging.getLogger(__name__)
 
@@ -41,6 +45,18 @@ DAY_ALIASES = {
     "sunday": {"sunday", "sun", "su"},
 }
 
+# Patterns used by the per-cell text helpers below; compiled once rather than
+# looked up in re's pattern cache on every call.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TOKEN_RE = re.compile(r"[a-z0-9:]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Date-header patterns: every header is probed on each cache build and the
+# legacy helpers probe them again per lookup.
+_MDYYYY_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
+_DATED_HEADER_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}\s*([+\-–—:]\s*(.+))?$")
+_MS_PREFIX_RE = re.compile(r"^ms\s*")
+
 
 # ---------------------------------------------------------------------------
 # Google client utilities
@@ -49,14 +65,22 @@ DAY_ALIASES = {
 
 ENV_KEY = "GOOGLE_SERVICE_ACCOUNT_JSON"
 
+# Authorised clients keyed by the raw credentials payload, and opened
+# worksheets keyed by (sheet_id, tab_name).  Re-authorising and re-opening
+# the spreadsheet costs several OAuth/metadata round-trips, so both are
+# kept for the life of the worker.
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+_WORKSHEET_CACHE: Dict[Tuple[str, str], gspread.Worksheet] = {}
+
+
+def reset_client_cache() -> None:
+    """Drop cached Google clients and worksheet handles."""
+
+    _CLIENT_CACHE.clear()
+    _WORKSHEET_CACHE.clear()
 
-def _client_from_env() -> gspread.Client:
-    log.debug("Initialising Google Sheets client using %s", ENV_KEY)
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
 
+def _client_from_env() -> gspread.Client:
     creds_json = os.getenv(ENV_KEY)
     if not creds_json:
         log.error("Environment variable %s is not configured.", ENV_KEY)
@@ -65,6 +89,16 @@ def _client_from_env() -> gspread.Client:
             "Set it to the full JSON payload of your service account key."
         )
 
+    cached = _CLIENT_CACHE.get(creds_json)
+    if cached is not None:
+        return cached
+
+    log.debug("Initialising Google Sheets client using %s", ENV_KEY)
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive",
+    ]
+
     try:
         info = json.loads(creds_json)
     except json.JSONDecodeError as exc:
@@ -84,10 +118,11 @@ def _client_from_env() -> gspread.Client:
         raise
 
     log.debug("Google Sheets client initialised successfully.")
+    # Rotated credentials replace the old client rather than accumulating.
+    _CLIENT_CACHE.clear()
+    _WORKSHEET_CACHE.clear()
+    _CLIENT_CACHE[creds_json] = client
     return client
-    info = json.loads(creds_json)
-    creds = Credentials.from_service_account_info(info, scopes=scopes)
-    return gspread.authorize(creds)
 
 
 @dataclass
@@ -97,9 +132,14 @@ class SheetConfig:
 
 
 def _open_ws(cfg: SheetConfig) -> gspread.Worksheet:
+    gc = _client_from_env()
+    key = (cfg.sheet_id, cfg.tab_name)
+    ws = _WORKSHEET_CACHE.get(key)
+    if ws is not None:
+        return ws
+
     log.debug("Opening worksheet: sheet_id=%s tab_name=%s", cfg.sheet_id, cfg.tab_name)
     try:
-        gc = _client_from_env()
         sh = gc.open_by_key(cfg.sheet_id)
         ws = sh.worksheet(cfg.tab_name)
     except Exception:
@@ -108,10 +148,15 @@ def _open_ws(cfg: SheetConfig) -> gspread.Worksheet:
         )
         raise
 
+    _WORKSHEET_CACHE[key] = ws
     log.debug("Worksheet opened successfully: %s / %s", cfg.sheet_id, cfg.tab_name)
     return ws
 
 
+def _forget_ws(cfg: SheetConfig) -> None:
+    """Evict a cached worksheet so the next call reopens it (e.g. after errors)."""
+
+    _WORKSHEET_CACHE.pop((cfg.sheet_id, cfg.tab_name), None)
 
 
 # ---------------------------------------------------------------------------
@@ -119,50 +164,39 @@ def _open_ws(cfg: SheetConfig) -> gspread.Worksheet:
 # ---------------------------------------------------------------------------
 
 
-def _detect_header_row(rows: Iterable[Iterable[str]], max_scan: int = 10) -> int:
-    def norm(s):
-        return re.sub(r"[^a-z0-9]+", "", (s or "").strip().lower())
+_HEADER_NAME_KEYS = frozenset({"namefirst", "firstname", "first", "namelast", "lastname", "last"})
+_HEADER_MS_KEYS = frozenset({"mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort"})
+
 
+def _detect_header_row(rows: Iterable[Iterable[str]], max_scan: int = 10) -> int:
     for i in range(min(max_scan, len(rows))):
         r = list(rows[i])
         if not r:
             continue
-        norms = [norm(c) for c in r]
-        has_nameish = any(k in norms for k in ["namefirst", "firstname", "first", "namelast", "lastname", "last"])
-        has_msish = any(k in norms for k in ["mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort"])
+        norms = {_norm(c) for c in r}
+        has_nameish = not _HEADER_NAME_KEYS.isdisjoint(norms)
+        has_msish = not _HEADER_MS_KEYS.isdisjoint(norms)
         nonempty = sum(1 for c in r if (c or "").strip() != "")
         if (has_nameish or has_msish) and nonempty >= 3:
             return i
     return 0
 
 
+def _values_digest(rows: List[List[str]]) -> bytes:
+    """Cheap fingerprint of a worksheet grid, used to skip no-op rebuilds."""
 
-
-# ---------------------------------------------------------------------------
-# DataFrame helpers (ported from the original scripts)
-# ---------------------------------------------------------------------------
-
-
-def _detect_header_row(rows: Iterable[Iterable[str]], max_scan: int = 10) -> int:
-    def norm(s):
-        return re.sub(r"[^a-z0-9]+", "", (s or "").strip().lower())
-
-    for i in range(min(max_scan, len(rows))):
-        r = list(rows[i])
-        if not r:
-            continue
-        norms = [norm(c) for c in r]
-        has_nameish = any(k in norms for k in ["namefirst", "firstname", "first", "namelast", "lastname", "last"])
-        has_msish = any(k in norms for k in ["mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort"])
-        nonempty = sum(1 for c in r if (c or "").strip() != "")
-        if (has_nameish or has_msish) and nonempty >= 3:
-            return i
-    return 0
+    payload = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
 
-def _sheet_to_df(ws: gspread.Worksheet, return_meta: bool = False):
-    log.debug("Fetching all values for worksheet %s", ws.title)
-    rows = ws.get_all_values()
+def _sheet_to_df(
+    ws: gspread.Worksheet,
+    return_meta: bool = False,
+    rows: Optional[List[List[str]]] = None,
+):
+    if rows is None:
+        log.debug("Fetching all values for worksheet %s", ws.title)
+        rows = ws.get_all_values()
     log.debug("Worksheet %s returned %d rows", ws.title, len(rows))
     if not rows:
         log.error("Worksheet %s appears to be empty.", ws.title)
@@ -173,11 +207,14 @@ def _sheet_to_df(ws: gspread.Worksheet, return_meta: bool = False):
     data = rows[hdr_idx + 1 :]
 
     last_nonempty = max((i for i, h in enumerate(header) if (h or "").strip() != ""), default=-1)
-    if last_nonempty >= 0:
-        header = header[: last_nonempty + 1]
-        data = [r[: last_nonempty + 1] for r in data]
 
-    df = pd.DataFrame(data, columns=header)
+    # get_all_values() returns a rectangular grid of strings (blanks are ""),
+    # so every column is already text and readers can use .str directly.
+    # Hand the raw rows to pandas in one go and trim trailing blank columns
+    # with a single slice instead of re-slicing every row list in Python.
+    df = pd.DataFrame(data, columns=header) if data else pd.DataFrame(columns=header)
+    if last_nonempty >= 0:
+        df = df.iloc[:, : last_nonempty + 1]
     log.debug(
         "DataFrame for worksheet %s created with shape %s (header row %d)",
         ws.title,
@@ -193,17 +230,39 @@ def _normalize_name(first: str, last: str) -> str:
     return f"{first.strip()} {last.strip()}".strip()
 
 
+def name_sort_key(name: str) -> Tuple[str, str]:
+    """Return the (last, first) ordering key shared by every roster listing."""
+
+    parts = (name or "").split(" ")
+    return parts[-1].lower(), parts[0].lower()
+
+
+# MS levels are a small closed set; a dict lookup orders them numerically
+# without parsing digits out of every value.
+_MS_ORDER = {str(level): level for level in range(1, 6)}
+
+
+def ms_sort_key(ms: str) -> Tuple[int, str]:
+    """Order MS levels 1-5 numerically, with anything unexpected after them."""
+
+    return _MS_ORDER.get(ms, 99), ms
+
+
+# Header probes: the same few dozen headers are tested on every cache build
+# (and by the legacy report helpers), so the results are memoised.
+@lru_cache(maxsize=512)
 def _extract_date_str(text: str) -> Optional[str]:
     if not text:
         return None
-    m = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
+    m = _MDYYYY_RE.search(text)
     return m.group(1) if m else None
 
 
+@lru_cache(maxsize=512)
 def _event_from_header(header: str) -> str:
     if not header:
         return ""
-    m = re.search(r"\d{1,2}/\d{1,2}/\d{4}\s*([+\-–—:]\s*(.+))?$", header.strip())
+    m = _DATED_HEADER_RE.search(header.strip())
     if m and m.group(2):
         return m.group(2).strip()
     return ""
@@ -217,7 +276,7 @@ def _target_date_formats(target: str) -> List[str]:
             candidates.add(f"{dt.month}/{dt.day}/{dt.year}")
         except Exception:
             pass
-    if re.fullmatch(r"\d{1,2}/\d{1,2}/\d{4}", target.strip()):
+    if _MDYYYY_RE.fullmatch(target.strip()):
         candidates.add(target.strip())
     return list(candidates)
 
@@ -249,6 +308,7 @@ def _find_date_column(df: pd.DataFrame, target_date: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1024)
 def _classify_status(cell_value: str) -> Optional[str]:
     v = (cell_value or "").strip().lower()
     if not v:
@@ -263,18 +323,61 @@ def _classify_status(cell_value: str) -> Optional[str]:
 
 
 def _norm(s: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (s or "").strip().lower())
-
+    # The pattern already removes surrounding whitespace, so no strip() pass.
+    return _NON_ALNUM_RE.sub("", (s or "").lower())
+
+
+@lru_cache(maxsize=32)
+def _header_index(headers: Tuple[str, ...]) -> Dict[str, Tuple[int, str]]:
+    """Map each normalised header to its first (position, column).
+
+    Keyed on the header tuple so the column lookups made while building one
+    cache share a single normalisation pass over the schema.
+    """
+
+    index: Dict[str, Tuple[int, str]] = {}
+    for pos, col in enumerate(headers):
+        index.setdefault(_norm(col), (pos, col))
+    return index
+
+
+# Header aliases shared by every roster reader.  Plain entries are compared
+# against _norm(header); "re:" entries are regexes searched case-insensitively.
+_FIRST_NAME_KEYS = (
+    "namefirst",
+    "firstname",
+    "first",
+    "fname",
+    "givenname",
+    "re:^name.*first$",
+    "re:^first\\b",
+)
+_LAST_NAME_KEYS = (
+    "namelast",
+    "lastname",
+    "last",
+    "lname",
+    "surname",
+    "familyname",
+    "re:^name.*last$",
+    "re:^last\\b",
+)
+_MS_KEYS = ("mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort", "re:^ms\\s*level$", "re:^ms\\b")
+_RESPONSE_FIRST_KEYS = ("firstname", "first", "fname", "re:^first\\b")
+_RESPONSE_LAST_KEYS = ("lastname", "last", "lname", "re:^last\\b")
+
+
+@lru_cache(maxsize=64)
+def _resolve_col(headers: Tuple[str, ...], wanted_keys: Tuple[str, ...]) -> Optional[str]:
+    # Memoized per (header layout, alias tuple): the roster and form layouts
+    # rarely change, so after the first refresh every lookup is a cache hit.
+    index = _header_index(headers)
+    hits = [index[w] for w in wanted_keys if not w.startswith("re:") and w in index]
+    if hits:
+        # Earliest matching header wins, regardless of alias order.
+        return min(hits)[1]
 
-def _find_col(df: pd.DataFrame, wanted_keys: List[str]) -> Optional[str]:
-    headers = list(df.columns)
-    norm_map = {col: _norm(col) for col in headers}
-    wanted_norm = {w for w in wanted_keys if not w.startswith("re:")}
     wanted_regex = [re.compile(w[3:], re.I) for w in wanted_keys if w.startswith("re:")]
-
-    for col, nm in norm_map.items():
-        if nm in wanted_norm:
-            return col
     for col in headers:
         for rx in wanted_regex:
             if rx.search(col):
@@ -282,15 +385,20 @@ def _find_col(df: pd.DataFrame, wanted_keys: List[str]) -> Optional[str]:
     return None
 
 
+def _find_col(df: pd.DataFrame, wanted_keys: Iterable[str]) -> Optional[str]:
+    return _resolve_col(tuple(df.columns), tuple(wanted_keys))
+
+
 def _guess_ms_col(df: pd.DataFrame) -> Optional[str]:
     headers = list(df.columns)
     for i, col in enumerate(headers):
         s = df.iloc[:, i]
-        vals = s.astype(str).str.strip().str.lower()
+        vals = s.str.strip().str.lower()
         sample = vals[vals != ""].head(30)
         if sample.empty:
             continue
-        ok = sample.apply(lambda v: v in {"1", "2", "3", "4", "5"} or re.fullmatch(r"ms\s*\d", v) is not None).mean()
+        # One vectorised match instead of a Python lambda per sampled cell.
+        ok = sample.str.fullmatch(r"[1-5]|ms\s*\d").mean()
         if ok >= 0.7:
             return col
     return None
@@ -304,7 +412,7 @@ def _get_series(df: pd.DataFrame, colname: str) -> pd.Series:
 
 
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.strip().lower()).strip("-")
+    slug = _NON_ALNUM_RE.sub("-", value.strip().lower()).strip("-")
     return slug or "cadet"
 
 
@@ -324,18 +432,21 @@ def _program_column(df: pd.DataFrame, hint: str = "") -> Optional[str]:
         preferred.append(_norm(hint))
     preferred.extend(["school", "campus", "program", "university", "college", "institution"])
 
-    norm_map = {col: _norm(col) for col in df.columns}
+    index = _header_index(tuple(df.columns))
     for want in preferred:
-        for col, norm_val in norm_map.items():
-            if norm_val == want:
-                return col
+        if want in index:
+            return index[want][1]
     return None
 
 
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip())
+    # split()/join collapses and trims whitespace in one C-level pass.
+    return " ".join((value or "").split())
 
 
+# Form answers repeat heavily across cadets and days ("Yes", "No", "0900-1000"),
+# so the per-cell classifiers below are memoised on the raw text.
+@lru_cache(maxsize=4096)
 def _bool_from_response(text: str) -> Optional[bool]:
     value = (text or "").strip().lower()
     if not value:
@@ -349,16 +460,53 @@ def _bool_from_response(text: str) -> Optional[bool]:
     return None
 
 
-def _tokenise(text: str) -> List[str]:
-    cleaned = re.sub(r"[^a-z0-9:]+", " ", (text or "").lower())
-    parts = [p for p in cleaned.split() if p]
-    extra = []
+@lru_cache(maxsize=4096)
+def _response_tokens(column: str, value: str) -> frozenset:
+    # Shared frozensets also pickle once per distinct answer rather than per cell.
+    return frozenset(tokenise(column + " " + value))
+
+
+@lru_cache(maxsize=512)
+def _day_for_header(header: str) -> Optional[str]:
+    lower_header = header.lower()
+    for canonical, aliases in DAY_ALIASES.items():
+        if any(alias in lower_header for alias in aliases):
+            return canonical
+    return None
+
+
+def tokenise(text: str) -> List[str]:
+    """Split free text into the match tokens shared by answers and queries."""
+
+    # One findall pass yields the tokens directly; "-" is a separator in
+    # _TOKEN_RE, so only "9:00"-style tokens need splitting further.
+    parts = _TOKEN_RE.findall((text or "").lower())
+    tokens = set(parts)
     for part in parts:
-        if "-" in part:
-            extra.extend(part.split("-"))
         if ":" in part:
-            extra.extend(part.split(":"))
-    return list({*parts, *extra})
+            tokens.update(part.split(":"))
+    return list(tokens)
+
+
+def summarise_availability(entries: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+    """Return the answered weekdays and the ten most common time tokens.
+
+    Computed once per CSV fetch and stored with the availability cache so
+    the checker page does not rescan every response on each request.
+    """
+
+    options = set()
+    counts: Dict[str, int] = {}
+    for entry in entries:
+        for day, responses in entry.get("days", {}).items():
+            if responses:
+                options.add(day)
+            for resp in responses:
+                for token in resp.get("tokens", ()):
+                    if token.isdigit() or ":" in token or "am" in token or "pm" in token:
+                        counts[token] = counts.get(token, 0) + 1
+    common = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+    return sorted(options), [token for token, _ in common[:10]]
 
 
 # ---------------------------------------------------------------------------
@@ -371,6 +519,7 @@ def build_attendance_cache(sheet_id: str, tab_name: str, program_hint: str = "")
     try:
         result = _build_attendance_cache_core(sheet_id, tab_name, program_hint)
     except Exception:
+        _forget_ws(SheetConfig(sheet_id, tab_name))
         log.exception(
             "Failed to build attendance cache", extra={"sheet_id": sheet_id, "tab_name": tab_name}
         )
@@ -384,39 +533,29 @@ def build_attendance_cache(sheet_id: str, tab_name: str, program_hint: str = "")
     return result
 
 
+# Last attendance payload per (sheet_id, tab_name, program_hint) with the
+# digest of the grid it was built from.  Scheduled refreshes of an untouched
+# roster then skip the whole DataFrame/classification pipeline.
+_ATTENDANCE_SNAPSHOTS: Dict[Tuple[str, str, str], Tuple[bytes, Dict[str, Any]]] = {}
+
+
 def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str) -> Dict[str, Any]:
     ws = _open_ws(SheetConfig(sheet_id, tab_name))
-    df, header_idx, last_col = _sheet_to_df(ws, return_meta=True)
-
-    first_col = _find_col(
-        df,
-        [
-            "namefirst",
-            "firstname",
-            "first",
-            "fname",
-            "givenname",
-            "re:^name.*first$",
-            "re:^first\\b",
-        ],
-    )
-    last_name_col = _find_col(
-        df,
-        [
-            "namelast",
-            "lastname",
-            "last",
-            "lname",
-            "surname",
-            "familyname",
-            "re:^name.*last$",
-            "re:^last\\b",
-        ],
-    )
-    ms_col = _find_col(
-        df,
-        ["mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort", "re:^ms\\s*level$", "re:^ms\\b"],
-    ) or _guess_ms_col(df)
+    log.debug("Fetching all values for worksheet %s", ws.title)
+    rows = ws.get_all_values()
+
+    snapshot_key = (sheet_id, tab_name, program_hint)
+    digest = _values_digest(rows)
+    previous = _ATTENDANCE_SNAPSHOTS.get(snapshot_key)
+    if previous and previous[0] == digest:
+        log.debug("Attendance sheet unchanged since last build; reusing payload")
+        return {**previous[1], "generated_at": datetime.utcnow().isoformat() + "Z"}
+
+    df, header_idx, last_col = _sheet_to_df(ws, return_meta=True, rows=rows)
+
+    first_col = _find_col(df, _FIRST_NAME_KEYS)
+    last_name_col = _find_col(df, _LAST_NAME_KEYS)
+    ms_col = _find_col(df, _MS_KEYS) or _guess_ms_col(df)
 
     if not (first_col and last_name_col and ms_col):
         raise ValueError("Could not detect first/last/MS columns in attendance sheet.")
@@ -445,17 +584,35 @@ def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str
 
     ms_series = (
         _get_series(df, ms_col)
-        .astype(str)
         .str.lower()
-        .str.replace(r"^ms\s*", "", regex=True)
+        .str.replace(_MS_PREFIX_RE, "", regex=True)
         .str.strip()
     )
     program_series = (
-        _get_series(df, program_col).astype(str).str.strip() if program_col else pd.Series(["" for _ in range(len(df))])
+        _get_series(df, program_col).str.strip() if program_col else pd.Series("", index=df.index)
     )
 
-    first_series = _get_series(df, first_col).astype(str)
-    last_series = _get_series(df, last_name_col).astype(str)
+    first_series = _get_series(df, first_col).str.strip()
+    last_series = _get_series(df, last_name_col).str.strip()
+    name_series = (first_series + " " + last_series).str.strip()
+    # Blank roster rows (spacers, trailing formatting) are dropped with one
+    # column-wise mask instead of being visited and skipped in the loop.
+    named_rows = name_series.ne("").to_numpy().nonzero()[0].tolist()
+
+    first_values = first_series.tolist()
+    last_values = last_series.tolist()
+    name_values = name_series.tolist()
+    ms_values = ms_series.tolist()
+    program_values = program_series.tolist()
+
+    # Read and classify every date column once, column-wise, so the
+    # per-cadet loop below only indexes into plain lists instead of
+    # materialising each row with iterrows() and probing it per date.
+    status_columns = []
+    for col_info in date_columns:
+        raw_values = _get_series(df, col_info["header"]).str.strip().tolist()
+        classified = {value: _classify_status(value) for value in set(raw_values)}
+        status_columns.append((col_info, raw_values, [classified[value] for value in raw_values]))
 
     per_event: Dict[str, Any] = {}
     cadets: List[Dict[str, Any]] = []
@@ -463,17 +620,15 @@ def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str
     by_name: Dict[str, Dict[str, Any]] = {}
     ms_levels_set = set()
 
-    for idx, row in df.iterrows():
-        first = first_series.iloc[idx].strip()
-        last = last_series.iloc[idx].strip()
-        name = _normalize_name(first, last)
-        if not name:
-            continue
+    for idx in named_rows:
+        first = first_values[idx]
+        last = last_values[idx]
+        name = name_values[idx]
 
-        ms_value = ms_series.iloc[idx] or ""
+        ms_value = ms_values[idx] or ""
         if ms_value:
             ms_levels_set.add(ms_value)
-        program_value = program_series.iloc[idx].strip()
+        program_value = program_values[idx].strip()
 
         slug_base = _slugify(name)
         slug = f"{slug_base}-{header_idx + 2 + idx}"
@@ -481,10 +636,10 @@ def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str
         attendance_entries: List[Dict[str, Any]] = []
         status_counts = {status: 0 for status in STATUS_KEYS}
 
-        for col_info in date_columns:
+        for col_info, raw_values, statuses in status_columns:
             header = col_info["header"]
-            raw_value = str(row.get(header, "") or "").strip()
-            normalized = _classify_status(raw_value)
+            raw_value = raw_values[idx]
+            normalized = statuses[idx]
             entry = {
                 "date": col_info["iso"],
                 "label": header,
@@ -527,6 +682,11 @@ def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str
             "ms": ms_value,
             "school": program_value,
             "normalized_name": _norm(name),
+            "sort_key": name_sort_key(name),
+            # Lower-cased once here so directory searches can test
+            # substrings without re-lowering every cadet per request.
+            "search_name": name.lower(),
+            "search_school": program_value.lower(),
             "sheet_row": header_idx + 2 + idx,
             "attendance": attendance_entries,
             "status_counts": status_counts,
@@ -556,19 +716,23 @@ def _build_attendance_cache_core(sheet_id: str, tab_name: str, program_hint: str
 
     latest_event = events[-1] if events else None
 
-    return {
+    result = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "header_row": header_idx + 1,
         "last_column_index": last_col,
-        "ms_levels": sorted(ms_levels_set),
+        "ms_levels": sorted(ms_levels_set, key=ms_sort_key),
+        "schools": sorted({cadet["school"] for cadet in cadets if cadet["school"]}),
         "date_columns": date_columns,
         "events": events,
+        "event_index": {event["iso"]: event for event in events},
         "latest_event": latest_event,
         "cadets": cadets,
         "cadet_index": cadet_index,
         "by_name": by_name,
         "per_event": per_event,
     }
+    _ATTENDANCE_SNAPSHOTS[snapshot_key] = (digest, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -590,19 +754,107 @@ def build_availability_cache(csv_url: str, name_column_override: str = "") -> Di
     return result
 
 
-def _build_availability_cache_core(csv_url: str, name_column_override: str) -> Dict[str, Any]:
-    response = requests.get(csv_url, timeout=30)
-    log.debug(
-        "Availability CSV response: status=%s bytes=%d", response.status_code, len(response.content)
-    )
-    response.raise_for_status()
+# Shared HTTP session for the published CSV: keeps the TLS connection to
+# Google alive between refreshes and retries throttling/5xx responses once
+# instead of failing the build.  Refreshes run on request threads, so the
+# limits below keep the worst case, (_CSV_RETRIES + 1) * sum(_CSV_TIMEOUT)
+# plus _CSV_RETRIES * _CSV_RETRY_WAIT_MAX (about 24s), under gunicorn's 30s
+# default worker timeout.
+_CSV_TIMEOUT = (3.05, 8)
+_CSV_RETRIES = 1
+_CSV_RETRY_WAIT_MAX = 2.0
+_HTTP_SESSION: Optional[requests.Session] = None
+
+
+class _BoundedRetry(Retry):
+    """urllib3 Retry whose backoff and honoured Retry-After are both capped."""
+
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), _CSV_RETRY_WAIT_MAX)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _CSV_RETRY_WAIT_MAX)
+
+
+def _http_session() -> requests.Session:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        retry = _BoundedRetry(
+            total=_CSV_RETRIES,
+            read=0,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=4)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+# Last payload built per (csv_url, name override) with the validators needed
+# to revalidate it.  An unchanged sheet then answers 304 with no body and the
+# previous payload is reused instead of re-parsing the CSV.
+_CSV_SNAPSHOTS: Dict[Tuple[str, str], Tuple[Dict[str, str], Dict[str, Any]]] = {}
 
-    df = pd.read_csv(io.StringIO(response.text), dtype=str, keep_default_na=False)
+
+def _build_availability_cache_core(csv_url: str, name_column_override: str) -> Dict[str, Any]:
+    snapshot_key = (csv_url, name_column_override)
+    previous = _CSV_SNAPSHOTS.get(snapshot_key)
+    request_headers = previous[0] if previous else {}
+
+    with _http_session().get(
+        csv_url, timeout=_CSV_TIMEOUT, stream=True, headers=request_headers
+    ) as response:
+        log.debug("Availability CSV response: status=%s", response.status_code)
+        if response.status_code == 304 and previous:
+            log.debug("Availability CSV not modified; reusing previous payload")
+            return {**previous[1], "generated_at": datetime.utcnow().isoformat() + "Z"}
+        response.raise_for_status()
+
+        validators: Dict[str, str] = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        # Feed the body straight into pandas' C parser as it streams in
+        # rather than decoding the whole payload into a str first.  Every
+        # column is text, so skip NA detection entirely (blanks stay "").
+        # utf-8-sig drops a leading BOM while decoding, so the first header
+        # never carries a stray "\ufeff".
+        response.raw.decode_content = True
+        df = pd.read_csv(
+            response.raw,
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+            engine="c",
+            encoding="utf-8-sig",
+        )
     log.debug("Availability CSV parsed with shape %s", df.shape)
-    response = requests.get(csv_url, timeout=30)
-    response.raise_for_status()
 
-    df = pd.read_csv(io.StringIO(response.text), dtype=str, keep_default_na=False)
+    # Published form exports trail columns nobody ever filled in; drop them
+    # before every entry copies them into its raw map.  Weekday columns stay
+    # so the day options do not depend on who has answered so far.
+    # Built per column rather than with df.apply: on a form with headers but
+    # no responses yet, apply's empty-frame path returns a frame, not a mask.
+    answered = {column: df[column].str.strip().ne("").any() for column in df.columns}
+    keep = [
+        column
+        for column in df.columns
+        if answered[column] or column == name_column_override or _day_for_header(column)
+    ]
+    if len(keep) < len(df.columns):
+        log.debug("Dropping %d empty availability columns", len(df.columns) - len(keep))
+        df = df[keep]
+
     name_column = ""
 
     if name_column_override and name_column_override in df.columns:
@@ -617,52 +869,61 @@ def _build_availability_cache_core(csv_url: str, name_column_override: str) -> D
             "preferred name",
             "re:^name$",
         ]
-        norm_map = {col: _norm(col) for col in df.columns}
+        index = _header_index(tuple(df.columns))
         for cand in candidates:
-            norm_cand = _norm(cand)
-            for col, nm in norm_map.items():
-                if nm == norm_cand:
-                    name_column = col
-                    log.debug("Detected name column: %s", name_column)
-                    break
-            if name_column:
+            hit = index.get(_norm(cand))
+            if hit:
+                name_column = hit[1]
+                log.debug("Detected name column: %s", name_column)
                 break
 
-    first_col = _find_col(df, ["firstname", "first", "fname", "re:^first\\b"])
-    last_col = _find_col(df, ["lastname", "last", "lname", "re:^last\\b"])
+    first_col = _find_col(df, _RESPONSE_FIRST_KEYS)
+    last_col = _find_col(df, _RESPONSE_LAST_KEYS)
 
     entries: List[Dict[str, Any]] = []
     index: Dict[str, Dict[str, Any]] = {}
     by_name: Dict[str, Dict[str, Any]] = {}
 
-    for _, row in df.iterrows():
-        if name_column:
-            name = str(row.get(name_column, "")).strip()
-        else:
-            first = str(row.get(first_col, "")).strip()
-            last = str(row.get(last_col, "")).strip()
-            name = _normalize_name(first, last)
+    # The header→weekday match only depends on the schema, so resolve it
+    # once here instead of rescanning DAY_ALIASES for every cell.
+    day_columns = [
+        (column, day) for column in df.columns if (day := _day_for_header(column))
+    ]
 
-        name = _clean_text(name)
-        if not name:
-            continue
+    # Resolve every respondent's display name column-wise up front rather
+    # than boxing each row into a Series with iterrows().
+    blank = pd.Series("", index=df.index, dtype=object)
+    if name_column:
+        raw_names = df[name_column]
+    else:
+        first_names = df[first_col].str.strip() if first_col else blank
+        last_names = df[last_col].str.strip() if last_col else blank
+        raw_names = first_names + " " + last_names
+    names = raw_names.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+
+    # Rows without a usable name are dropped with one mask before any
+    # per-row dicts are materialised.  A cadet who resubmitted the form
+    # keeps only the newest (last) response, matching the by_name lookup.
+    name_keys = names.str.lower().str.replace(_NON_ALNUM_RE, "", regex=True)
+    named = names.ne("") & ~name_keys.duplicated(keep="last")
+    names = names[named]
+
+    # Same normalisation as _clean_text, but run per column in pandas' string
+    # methods instead of once per cell inside the row loop.
+    cleaned = df[named].apply(
+        lambda column: column.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+    )
 
+    for name, row_dict in zip(names.tolist(), cleaned.to_dict("records")):
         slug = f"{_slugify(name)}-{len(entries)+1}"
-        row_dict = {col: _clean_text(str(row[col])) for col in df.columns}
 
         day_map: Dict[str, List[Dict[str, Any]]] = {day: [] for day in DAY_ALIASES}
 
-        for column, raw_value in row_dict.items():
-            lower_header = column.lower()
-            target_day = None
-            for canonical, aliases in DAY_ALIASES.items():
-                if any(alias in lower_header for alias in aliases):
-                    target_day = canonical
-                    break
-            if not target_day:
-                continue
-
-            tokens = _tokenise(column + " " + raw_value)
+        for column, target_day in day_columns:
+            raw_value = row_dict[column]
+            # Stored as a frozenset so availability searches can test
+            # membership directly instead of building a set per request.
+            tokens = _response_tokens(column, raw_value)
             day_map[target_day].append(
                 {
                     "column": column,
@@ -684,14 +945,22 @@ def _build_availability_cache_core(csv_url: str, name_column_override: str) -> D
         index[slug] = entry
         by_name[_norm(name)] = entry
 
-    entries.sort(key=lambda item: item["name"].split(" ")[-1].lower())
+    entries.sort(key=lambda item: name_sort_key(item["name"]))
+    day_options, time_suggestions = summarise_availability(entries)
 
-    return {
+    result = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "entries": entries,
         "index": index,
         "by_name": by_name,
+        "day_options": day_options,
+        "time_suggestions": time_suggestions,
     }
+    if validators:
+        _CSV_SNAPSHOTS[snapshot_key] = (validators, result)
+    else:
+        _CSV_SNAPSHOTS.pop(snapshot_key, None)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -706,6 +975,7 @@ def build_umr_cache(sheet_id: str, tab_name: str, mapping_json: str = "") -> Dic
     try:
         result = _build_umr_cache_core(sheet_id, tab_name, mapping_json)
     except Exception:
+        _forget_ws(SheetConfig(sheet_id, tab_name))
         log.exception(
             "Failed to build UMR cache", extra={"sheet_id": sheet_id, "tab_name": tab_name}
         )
@@ -729,6 +999,7 @@ def _build_umr_cache_core(sheet_id: str, tab_name: str, mapping_json: str) -> Di
         if not isinstance(mapping, list):
             raise ValueError("UMR mapping must be a list of objects")
 
+        cell_sets = []
         for item in mapping:
             if not isinstance(item, dict):
                 continue
@@ -737,18 +1008,27 @@ def _build_umr_cache_core(sheet_id: str, tab_name: str, mapping_json: str) -> Di
             title_cell = item.get("title_cell")
             if not (position_cell and name_cell):
                 continue
-            position = ws.acell(position_cell).value
-            name = ws.acell(name_cell).value
-            title = ws.acell(title_cell).value if title_cell else ""
+            cell_sets.append((position_cell, name_cell, title_cell or ""))
+
+        # Every mapped cell is known up front, so read them all in a single
+        # values.batchGet round-trip instead of one acell() call per cell.
+        ranges = [cell for cells in cell_sets for cell in cells if cell]
+        values = {}
+        if ranges:
+            for cell, value_range in zip(ranges, ws.batch_get(ranges)):
+                values[cell] = value_range.first(default="")
+            log.debug("UMR mapping resolved %d cells in one batch read", len(ranges))
+
+        for position_cell, name_cell, title_cell in cell_sets:
             entries.append(
                 {
-                    "position": _clean_text(position),
-                    "name": _clean_text(name),
-                    "title": _clean_text(title),
+                    "position": _clean_text(values.get(position_cell, "")),
+                    "name": _clean_text(values.get(name_cell, "")),
+                    "title": _clean_text(values.get(title_cell, "")),
                     "cells": {
                         "position": position_cell,
                         "name": name_cell,
-                        "title": title_cell or "",
+                        "title": title_cell,
                     },
                 }
             )
@@ -787,6 +1067,32 @@ def _build_umr_cache_core(sheet_id: str, tab_name: str, mapping_json: str) -> Di
 # ---------------------------------------------------------------------------
 
 
+# Bounded retry for the writer's batch calls: only quota (429) and server
+# (5xx) errors are retried, so a permission error fails at once and a
+# persistent 429 gives up well inside the worker timeout.
+_WRITE_RETRY_ATTEMPTS = 5
+_WRITE_RETRY_MAX_WAIT = 30.0
+
+
+def _with_write_retries(call, *args, **kwargs):
+    for attempt in range(1, _WRITE_RETRY_ATTEMPTS + 1):
+        try:
+            return call(*args, **kwargs)
+        except APIError as exc:
+            status = getattr(exc.response, "status_code", None)
+            if attempt == _WRITE_RETRY_ATTEMPTS or not (status == 429 or (status or 0) >= 500):
+                raise
+            wait = min(_WRITE_RETRY_MAX_WAIT, 2 ** (attempt - 1))
+            log.warning(
+                "Sheets write failed with HTTP %s; retrying in %.0fs (attempt %d/%d)",
+                status,
+                wait,
+                attempt,
+                _WRITE_RETRY_ATTEMPTS,
+            )
+            time.sleep(wait)
+
+
 def _hex_to_rgb(hex_color: str) -> Dict[str, float]:
     value = hex_color.lstrip("#")
     if len(value) != 6:
@@ -804,13 +1110,26 @@ def ensure_date_column(
     target_iso: str,
     event_label: str,
     last_column_index: int,
+    pending: Optional[List[Dict[str, Any]]] = None,
 ) -> Tuple[int, List[Dict[str, Any]]]:
+    """Find or create the header for ``target_iso``.
+
+    When ``pending`` is given the header write is queued there as a
+    ``values.batchUpdate`` entry instead of being sent immediately.
+    """
+
+    def _write_header(column_index: int, text: str) -> None:
+        if pending is None:
+            ws.update_cell(header_row, column_index, text)
+        else:
+            pending.append({"range": rowcol_to_a1(header_row, column_index), "values": [[text]]})
+
     for col_info in date_columns:
         if col_info["iso"] == target_iso:
             header_value = col_info["header"]
             if event_label and event_label.lower() not in header_value.lower():
                 new_header = f"{_mdyyyy_from_iso(target_iso)} + {event_label}".strip()
-                ws.update_cell(header_row, col_info["column_index"], new_header)
+                _write_header(col_info["column_index"], new_header)
                 col_info["header"] = new_header
                 col_info["event"] = event_label
                 log.debug(
@@ -825,7 +1144,7 @@ def ensure_date_column(
     header_text = _mdyyyy_from_iso(target_iso)
     if event_label:
         header_text += f" + {event_label}" if "+" not in event_label else f" {event_label}"
-    ws.update_cell(header_row, new_col_index, header_text)
+    _write_header(new_col_index, header_text)
     log.debug(
         "Added new attendance column %d with header '%s'", new_col_index, header_text
     )
@@ -841,6 +1160,15 @@ def ensure_date_column(
     return new_col_index, date_columns
 
 
+def _column_run(rows: List[int], column_index: int, values_by_row: Dict[int, str]) -> Dict[str, Any]:
+    start = rowcol_to_a1(rows[0], column_index)
+    end = rowcol_to_a1(rows[-1], column_index)
+    return {
+        "range": start if start == end else f"{start}:{end}",
+        "values": [[values_by_row[row]] for row in rows],
+    }
+
+
 def write_attendance_entries(
     sheet_id: str,
     tab_name: str,
@@ -865,11 +1193,18 @@ def write_attendance_entries(
     )
     try:
         ws = _open_ws(SheetConfig(sheet_id, tab_name))
+        value_ranges: List[Dict[str, Any]] = []
         column_index, updated_columns = ensure_date_column(
-            ws, header_row, date_columns, target_iso, event_label, last_column_index
+            ws,
+            header_row,
+            date_columns,
+            target_iso,
+            event_label,
+            last_column_index,
+            pending=value_ranges,
         )
 
-        value_cells = []
+        values_by_row: Dict[int, str] = {}
         format_requests = []
 
         color_map = {
@@ -888,79 +1223,104 @@ def write_attendance_entries(
             if status == "Excused" and note:
                 value = f"Excused - {note}" if not status.lower().startswith("excused") else f"{status} - {note}"
 
-            a1 = rowcol_to_a1(row_number, column_index)
-            value_cells.append(Cell(row_number, column_index, value))
+            values_by_row[row_number] = value
             if status in color_map:
                 format_requests.append(
                     {
-                        "range": a1,
+                        "range": rowcol_to_a1(row_number, column_index),
                         "format": {"userEnteredFormat": {"backgroundColor": color_map[status]}},
                     }
                 )
 
-        if value_cells:
-            ws.update_cells(value_cells, value_input_option="USER_ENTERED")
-            log.debug("Updated %d cells in column %d", len(value_cells), column_index)
+        # Consecutive marked rows share one range so a dense roster goes out as
+        # a single column block.  Gaps are left alone rather than blanked, so
+        # marks for cadets outside this submission survive.
+        run: List[int] = []
+        for row_number in sorted(values_by_row):
+            if run and row_number != run[-1] + 1:
+                value_ranges.append(_column_run(run, column_index, values_by_row))
+                run = []
+            run.append(row_number)
+        if run:
+            value_ranges.append(_column_run(run, column_index, values_by_row))
+
+        if value_ranges:
+            # Header and status cells travel in one values.batchUpdate call.
+            _with_write_retries(ws.batch_update, value_ranges, value_input_option="USER_ENTERED")
+            log.debug(
+                "Updated %d cells in column %d across %d ranges",
+                len(values_by_row),
+                column_index,
+                len(value_ranges),
+            )
 
-        for request in format_requests:
-            ws.format(request["range"], request["format"])
+        if format_requests:
+            # All colour rules go out in one spreadsheets.batchUpdate rather
+            # than one format() round-trip per cadet.
+            _with_write_retries(ws.batch_format, format_requests)
+            log.debug("Applied %d status colours in one batch", len(format_requests))
 
         log.info(
-            "Successfully wrote %d attendance updates", len(value_cells), extra={"column_index": column_index}
+            "Successfully wrote %d attendance updates", len(values_by_row), extra={"column_index": column_index}
         )
-        return {"updated": len(value_cells), "column_index": column_index, "date_columns": updated_columns}
+        return {"updated": len(values_by_row), "column_index": column_index, "date_columns": updated_columns}
     except Exception:
+        _forget_ws(SheetConfig(sheet_id, tab_name))
         log.exception(
             "Failed to write attendance entries",
             extra={"sheet_id": sheet_id, "tab_name": tab_name, "target_iso": target_iso},
         )
         raise
-        return {"updated": 0}
 
-    ws = _open_ws(SheetConfig(sheet_id, tab_name))
-    column_index, updated_columns = ensure_date_column(ws, header_row, date_columns, target_iso, event_label, last_column_index)
 
-    value_cells = []
-    format_requests = []
+# ---------------------------------------------------------------------------
+# Legacy CLI compatibility wrappers (used by the CLI + cache helpers)
+# ---------------------------------------------------------------------------
 
-    color_map = {
-        "Present": _hex_to_rgb(color_present),
-        "FTR": _hex_to_rgb(color_ftr),
-        "Excused": _hex_to_rgb(color_excused),
-    }
 
-    for payload in updates:
-        row_number = payload["sheet_row"]
-        status = payload["status"]
-        if not status:
-            continue
-        value = status
-        note = payload.get("note", "").strip()
-        if status == "Excused" and note:
-            value = f"Excused - {note}" if not status.lower().startswith("excused") else f"{status} - {note}"
-
-        a1 = rowcol_to_a1(row_number, column_index)
-        value_cells.append(Cell(row_number, column_index, value))
-        if status in color_map:
-            format_requests.append(
-                {
-                    "range": a1,
-                    "format": {"userEnteredFormat": {"backgroundColor": color_map[status]}},
-                }
-            )
+def _load_roster_frame(sheet_id, tab_name) -> Tuple[pd.DataFrame, str, str]:
+    """Fetch the roster once and resolve the name/MS columns.
 
-    if value_cells:
-        ws.update_cells(value_cells, value_input_option="USER_ENTERED")
+    The returned frame carries a normalised ``_MS`` column so callers that
+    slice by several MS levels can reuse a single worksheet read.
+    """
 
-    for request in format_requests:
-        ws.format(request["range"], request["format"])
+    cfg = SheetConfig(sheet_id=sheet_id, tab_name=tab_name)
+    ws = _open_ws(cfg)
+    df = _sheet_to_df(ws)
 
-    return {"updated": len(value_cells), "column_index": column_index, "date_columns": updated_columns}
+    first_col = _find_col(df, _FIRST_NAME_KEYS)
+    last_col = _find_col(df, _LAST_NAME_KEYS)
+    ms_col = _find_col(df, _MS_KEYS) or _guess_ms_col(df)
 
+    if not (first_col and last_col and ms_col):
+        raise ValueError("Missing columns for First/Last/MS.")
 
-# ---------------------------------------------------------------------------
-# Legacy CLI compatibility wrappers (used by the CLI + cache helpers)
-# ---------------------------------------------------------------------------
+    df["_MS"] = (
+        _get_series(df, ms_col).str.lower().str.replace(_MS_PREFIX_RE, "", regex=True).str.strip()
+    )
+    return df, first_col, last_col
+
+
+def _attendance_buckets(
+    df: pd.DataFrame, first_col: str, last_col: str, date_col: str, ms_level
+) -> Dict[str, List[str]]:
+    wanted_ms = str(ms_level).lower().replace("ms", "").strip()
+    df_ms = df[df["_MS"] == wanted_ms]
+
+    # Column-wise equivalent of _classify_status/_normalize_name per row.
+    values = _get_series(df_ms, date_col).str.strip().str.lower()
+    names = (
+        _get_series(df_ms, first_col).str.strip()
+        + " "
+        + _get_series(df_ms, last_col).str.strip()
+    ).str.strip()
+    masks = {
+        "Present": values == "present",
+        "FTR": values == "ftr",
+        "Excused": values.str.startswith("excused"),
+    }
+    return {status: names[mask].tolist() for status, mask in masks.items()}
 
 
 def get_attendance_by_date(sheet_id, tab_name, target_date, ms_level) -> Dict[str, List[str]]:
@@ -973,59 +1333,13 @@ def get_attendance_by_date(sheet_id, tab_name, target_date, ms_level) -> Dict[st
             "ms_level": ms_level,
         },
     )
-    cfg = SheetConfig(sheet_id=sheet_id, tab_name=tab_name)
-    ws = _open_ws(cfg)
-    df = _sheet_to_df(ws)
-
-    first_col = _find_col(
-        df,
-        [
-            "namefirst",
-            "firstname",
-            "first",
-            "fname",
-            "givenname",
-            "re:^name.*first$",
-            "re:^first\\b",
-        ],
-    )
-    last_col = _find_col(
-        df,
-        [
-            "namelast",
-            "lastname",
-            "last",
-            "lname",
-            "surname",
-            "familyname",
-            "re:^name.*last$",
-            "re:^last\\b",
-        ],
-    )
-    ms_col = _find_col(
-        df,
-        ["mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort", "re:^ms\\s*level$", "re:^ms\\b"],
-    ) or _guess_ms_col(df)
-
-    if not (first_col and last_col and ms_col):
-        raise ValueError("Missing columns for First/Last/MS.")
+    df, first_col, last_col = _load_roster_frame(sheet_id, tab_name)
 
     date_col = _find_date_column(df, target_date)
     if not date_col:
         raise ValueError(f"No column for date {target_date}")
 
-    df["_MS"] = (
-        _get_series(df, ms_col).astype(str).str.lower().str.replace(r"^ms\s*", "", regex=True).str.strip()
-    )
-    wanted_ms = str(ms_level).lower().replace("ms", "").strip()
-    df_ms = df[df["_MS"] == wanted_ms].copy()
-
-    out = {"Present": [], "FTR": [], "Excused": []}
-    for _, row in df_ms.iterrows():
-        status = _classify_status(row.get(date_col, ""))
-        if status:
-            name = _normalize_name(str(row.get(first_col, "")), str(row.get(last_col, "")))
-            out[status].append(name)
+    out = _attendance_buckets(df, first_col, last_col, date_col, ms_level)
     log.debug(
         "Attendance by date fetched",
         extra={
@@ -1064,9 +1378,9 @@ def get_cadet_record(sheet_id, tab_name, first_name=None, last_name=None, full_n
     ws = _open_ws(cfg)
     df = _sheet_to_df(ws)
 
-    first_col = _find_col(df, ["namefirst", "firstname", "first", "fname", "givenname", "re:^name.*first$", "re:^first\\b"])
-    last_col = _find_col(df, ["namelast", "lastname", "last", "lname", "surname", "familyname", "re:^name.*last$", "re:^last\\b"])
-    ms_col = _find_col(df, ["mslevel", "ms", "mslvl", "msyear", "msclass", "mscohort", "re:^ms\\s*level$", "re:^ms\\b"]) or _guess_ms_col(df)
+    first_col = _find_col(df, _FIRST_NAME_KEYS)
+    last_col = _find_col(df, _LAST_NAME_KEYS)
+    ms_col = _find_col(df, _MS_KEYS) or _guess_ms_col(df)
 
     if not (first_col and last_col and ms_col):
         raise ValueError("Missing columns for First/Last/MS.")
@@ -1076,7 +1390,7 @@ def get_cadet_record(sheet_id, tab_name, first_name=None, last_name=None, full_n
         raise ValueError("No attendance date columns found.")
 
     df["_full"] = (
-        _get_series(df, first_col).astype(str).str.strip() + " " + _get_series(df, last_col).astype(str).str.strip()
+        _get_series(df, first_col).str.strip() + " " + _get_series(df, last_col).str.strip()
     ).str.lower()
 
     match = df[df["_full"] == target_full]
@@ -1105,8 +1419,15 @@ def daily_report(sheet_id, tab_name, target_date, ms_levels=("1", "2", "3", "4",
     rows, names_by_ms = [], {}
     total_present = total_ftr = total_excused = 0
 
+    # One worksheet read serves every MS level; the per-level buckets are
+    # carved out of the same frame instead of refetching the sheet.
+    df, first_col, last_col = _load_roster_frame(sheet_id, tab_name)
+    date_col = _find_date_column(df, target_date)
+    if not date_col:
+        raise ValueError(f"No column for date {target_date}")
+
     for ms in ms_levels:
-        buckets = get_attendance_by_date(sheet_id, tab_name, target_date, ms)
+        buckets = _attendance_buckets(df, first_col, last_col, date_col, ms)
         p, f, e = len(buckets["Present"]), len(buckets["FTR"]), len(buckets["Excused"])
         rows.append({"MS Level": ms, "Present": p, "FTR": f, "Excused": e, "Total": p + f + e})
         total_present += p
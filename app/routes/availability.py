@@ -1,4 +1,3 @@
-import re
 import secrets
 
 from flask import (
@@ -11,7 +10,12 @@ from flask import (
     url_for,
 )
 
-from ..integrations.google_sheets_attendance import DAY_ALIASES
+from ..integrations.google_sheets_attendance import (
+    DAY_ALIASES,
+    name_sort_key,
+    summarise_availability,
+    tokenise,
+)
 from ..utils.sheet_cache import get_cached_data
 
 bp = Blueprint("availability", __name__, url_prefix="/availability")
@@ -19,28 +23,22 @@ bp = Blueprint("availability", __name__, url_prefix="/availability")
 SESSION_KEY = "auth_availability"
 
 
-def _normalize_day(value: str) -> str | None:
-    clean = (value or "").strip().lower()
-    if not clean:
-        return None
+def _build_day_lookup() -> dict[str, str]:
+    # Every prefix of every alias maps to the first day (in DAY_ALIASES order)
+    # that claims it, matching the old first-match scan.
+    lookup: dict[str, str] = {}
     for canonical, aliases in DAY_ALIASES.items():
-        if clean == canonical or clean in aliases:
-            return canonical
-        if canonical.startswith(clean) or any(alias.startswith(clean) for alias in aliases):
-            return canonical
-    return None
+        for alias in (canonical, *sorted(aliases)):
+            for end in range(1, len(alias) + 1):
+                lookup.setdefault(alias[:end], canonical)
+    return lookup
+
 
+_DAY_LOOKUP = _build_day_lookup()
 
-def _tokenise(text: str) -> set[str]:
-    cleaned = re.sub(r"[^a-z0-9:]+", " ", (text or "").lower())
-    tokens = [p for p in cleaned.split() if p]
-    extras = []
-    for token in tokens:
-        if "-" in token:
-            extras.extend(token.split("-"))
-        if ":" in token:
-            extras.extend(token.split(":"))
-    return set(tokens + extras)
+
+def _normalize_day(value: str) -> str | None:
+    return _DAY_LOOKUP.get((value or "").strip().lower())
 
 
 @bp.before_request
@@ -81,33 +79,9 @@ def login():
         current_app.logger.warning(
             "Availability login failed", extra={"remote_addr": request.remote_addr}
         )
-            next_url = request.args.get("next") or url_for("availability.availability")
-            return redirect(next_url)
-        error = "Incorrect password."
     return render_template("password_prompt.html", error=error, title="Availability Checker Access")
 
 
-def _build_day_options(availability_data: dict) -> list[str]:
-    options = set()
-    for entry in availability_data.get("entries", []):
-        for day, responses in entry.get("days", {}).items():
-            if responses:
-                options.add(day)
-    return sorted(options)
-
-
-def _build_time_suggestions(availability_data: dict) -> list[str]:
-    counts = {}
-    for entry in availability_data.get("entries", []):
-        for responses in entry.get("days", {}).values():
-            for resp in responses:
-                for token in resp.get("tokens", []):
-                    if token.isdigit() or ":" in token or "am" in token or "pm" in token:
-                        counts[token] = counts.get(token, 0) + 1
-    common = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
-    return [token for token, _ in common[:10]]
-
-
 @bp.route("/", methods=["GET", "POST"])
 def availability():
     app = current_app
@@ -122,11 +96,14 @@ def availability():
     except Exception:
         app.logger.exception("Failed to load availability cache for availability")
         availability_data = {}
-    attendance_data = get_cached_data(app, "attendance")
-    availability_data = get_cached_data(app, "availability")
 
-    day_options = _build_day_options(availability_data)
-    time_suggestions = _build_time_suggestions(availability_data)
+    day_options = availability_data.get("day_options")
+    time_suggestions = availability_data.get("time_suggestions")
+    if day_options is None or time_suggestions is None:
+        # Snapshots written before these were precomputed.
+        day_options, time_suggestions = summarise_availability(
+            availability_data.get("entries", [])
+        )
 
     selected_day = ""
     selected_time = ""
@@ -136,7 +113,7 @@ def availability():
         selected_day = request.form.get("day", "")
         selected_time = request.form.get("time", "")
         day_key = _normalize_day(selected_day)
-        time_tokens = _tokenise(selected_time) if selected_time else set()
+        time_tokens = set(tokenise(selected_time)) if selected_time else set()
 
         cadets = attendance_data.get("cadets", [])
         availability_by_name = availability_data.get("by_name", {})
@@ -147,7 +124,9 @@ def availability():
             if avail_entry and day_key:
                 responses = list(avail_entry.get("days", {}).get(day_key, []))
                 if time_tokens:
-                    responses = [r for r in responses if time_tokens & set(r.get("tokens", []))]
+                    responses = [
+                        r for r in responses if not time_tokens.isdisjoint(r.get("tokens", ()))
+                    ]
 
             available_state = None
             if responses:
@@ -168,8 +147,7 @@ def availability():
         results.sort(
             key=lambda item: (
                 item["available"] is not True,
-                item["cadet"]["name"].split(" ")[-1].lower(),
-                item["cadet"]["name"].split(" ")[0].lower(),
+                item["cadet"].get("sort_key") or name_sort_key(item["cadet"]["name"]),
             )
         )
 
@@ -1,5 +1,6 @@
 from flask import Blueprint, current_app, render_template, request, abort
 
+from ..integrations.google_sheets_attendance import name_sort_key
 from ..utils.sheet_cache import get_cached_data
 
 bp = Blueprint("directory", __name__, url_prefix="/directory")
@@ -12,6 +13,13 @@ def _has_availability(cadet: dict, availability_by_name: dict) -> bool:
     return bool(key and key in availability_by_name)
 
 
+def _search_fields(cadet: dict) -> tuple[str, str]:
+    search_name = cadet.get("search_name")
+    if search_name is None:  # cache pickled before the fields existed
+        return cadet.get("name", "").lower(), cadet.get("school", "").lower()
+    return search_name, cadet.get("search_school", "")
+
+
 def _availability_entry(cadet: dict, availability: dict) -> dict | None:
     by_name = availability.get("by_name", {})
     key = cadet.get("normalized_name")
@@ -39,16 +47,17 @@ def directory():
     except Exception:
         app.logger.exception("Failed to load availability cache for directory")
         availability = {}
-    attendance = get_cached_data(app, "attendance")
-    availability = get_cached_data(app, "availability")
 
     cadets_raw = attendance.get("cadets", [])
     ms_levels = attendance.get("ms_levels", [])
-    schools = sorted({c.get("school", "") for c in cadets_raw if c.get("school", "")})
+    schools = attendance.get("schools") or sorted(
+        {c.get("school", "") for c in cadets_raw if c.get("school", "")}
+    )
 
     query = request.args.get("q", "").strip().lower()
     ms_filter = request.args.get("ms", "").strip()
     school_filter = request.args.get("school", "").strip()
+    school_filter_lower = school_filter.lower()
 
     filtered = []
     availability_by_name = availability.get("by_name", {})
@@ -58,11 +67,13 @@ def directory():
         school = cadet.get("school", "")
         ms_value = str(cadet.get("ms", ""))
 
-        if query and query not in name.lower() and query not in school.lower():
+        search_name, search_school = _search_fields(cadet)
+
+        if query and query not in search_name and query not in search_school:
             continue
         if ms_filter and ms_value != ms_filter:
             continue
-        if school_filter and school.lower() != school_filter.lower():
+        if school_filter and search_school != school_filter_lower:
             continue
 
         filtered.append(
@@ -73,10 +84,11 @@ def directory():
                 "school": school,
                 "status_counts": cadet.get("status_counts", {}),
                 "has_availability": _has_availability(cadet, availability_by_name),
+                "sort_key": cadet.get("sort_key") or name_sort_key(name),
             }
         )
 
-    filtered.sort(key=lambda item: (item["name"].split(" ")[-1].lower(), item["name"].split(" ")[0].lower()))
+    filtered.sort(key=lambda item: item["sort_key"])
 
     app.logger.debug(
         "Directory filtered",
@@ -116,11 +128,6 @@ def cadet_detail(cadet_id: str):
     cadet = attendance.get("cadet_index", {}).get(cadet_id)
     if not cadet:
         app.logger.warning("Cadet not found in directory detail", extra={"cadet_id": cadet_id})
-    attendance = get_cached_data(app, "attendance")
-    availability = get_cached_data(app, "availability")
-
-    cadet = attendance.get("cadet_index", {}).get(cadet_id)
-    if not cadet:
         abort(404)
 
     availability_entry = _availability_entry(cadet, availability)
@@ -1,5 +1,6 @@
 from flask import Blueprint, current_app, render_template
 
+from ..integrations.google_sheets_attendance import ms_sort_key, name_sort_key
 from ..utils.sheet_cache import get_cached_data
 
 bp = Blueprint("oml", __name__, url_prefix="/oml")
@@ -8,8 +9,7 @@ bp = Blueprint("oml", __name__, url_prefix="/oml")
 def _sort_key(ms: str, entry: dict) -> tuple:
     present = entry.get("present", 0)
     ftr = entry.get("ftr", 0)
-    name = entry.get("name", "")
-    name_key = (name.split(" ")[-1].lower(), name.split(" ")[0].lower())
+    name_key = entry.get("sort_key") or name_sort_key(entry.get("name", ""))
     if ms in {"1", "2"}:
         return (-present, name_key)
     return (ftr, -present, name_key)
@@ -24,7 +24,6 @@ def oml():
     except Exception:
         app.logger.exception("Failed to load attendance cache for OML")
         data = {}
-    data = get_cached_data(app, "attendance")
     cadets = data.get("cadets", [])
 
     per_ms = {}
@@ -39,6 +38,7 @@ def oml():
                 "ftr": counts.get("FTR", 0),
                 "excused": counts.get("Excused", 0),
                 "school": cadet.get("school"),
+                "sort_key": cadet.get("sort_key"),
             }
         )
 
@@ -49,7 +49,7 @@ def oml():
         sorted_list = sorted(cadet_list, key=lambda entry: _sort_key(ms, entry))
         leaderboard.append({"ms": ms, "cadets": sorted_list})
 
-    leaderboard.sort(key=lambda item: item["ms"])
+    leaderboard.sort(key=lambda item: ms_sort_key(item["ms"]))
 
     app.logger.debug(
         "OML leaderboard prepared",
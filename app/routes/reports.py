@@ -16,7 +16,6 @@ def reports():
     except Exception:
         app.logger.exception("Failed to load attendance cache for reports")
         data = {}
-    data = get_cached_data(app, "attendance")
 
     events = list(reversed(data.get("events", [])))  # newest first
     ms_levels = [ms for ms in data.get("ms_levels", []) if ms]
@@ -27,7 +26,9 @@ def reports():
 
     if events:
         if selected_iso:
-            selected_event = next((e for e in events if e.get("iso") == selected_iso), None)
+            # Snapshots written before event_index existed fall back to a scan.
+            event_index = data.get("event_index") or {e.get("iso"): e for e in events}
+            selected_event = event_index.get(selected_iso)
         if not selected_event:
             selected_event = events[0]
 
@@ -13,7 +13,7 @@ from flask import (
     url_for,
 )
 
-from ..integrations.google_sheets_attendance import write_attendance_entries
+from ..integrations.google_sheets_attendance import name_sort_key, write_attendance_entries
 from ..utils.sheet_cache import get_cached_data, refresh_cache
 
 URL_PREFIX = "/writer"
@@ -66,8 +66,6 @@ def login():
         current_app.logger.warning(
             "Writer login failed", extra={"remote_addr": request.remote_addr}
         )
-            return redirect(request.args.get("next") or url_for("writer.index"))
-        error = "Incorrect password."
 
     return render_template("password_prompt.html", title="Attendance Writer", error=error)
 
@@ -82,7 +80,7 @@ def _group_cadets(cadets: list[dict]) -> dict[str, list[dict]]:
             groups.setdefault("GSU", []).append(cadet)
         groups["Both"].append(cadet)
     for key in groups:
-        groups[key].sort(key=lambda c: (c.get("name", "").split(" ")[-1].lower(), c.get("name", "").split(" ")[0].lower()))
+        groups[key].sort(key=lambda c: c.get("sort_key") or name_sort_key(c.get("name", "")))
     return groups
 
 
@@ -91,11 +89,12 @@ def index():
     app = current_app
     app.logger.debug("Writer interface accessed", extra={"method": request.method})
     try:
-        attendance_data = get_cached_data(app, "attendance")
+        # Read past the in-process copy: another worker may have added a
+        # date column, and last_column_index decides where new dates go.
+        attendance_data = get_cached_data(app, "attendance", fresh=True)
     except Exception:
         app.logger.exception("Failed to load attendance cache for writer")
         attendance_data = {}
-    attendance_data = get_cached_data(app, "attendance")
     cadets = attendance_data.get("cadets", [])
     cadet_map = {c["id"]: c for c in cadets}
     groups = _group_cadets(cadets)
@@ -178,23 +177,6 @@ def index():
                             extra={"target_date": target_date, "event_label": event_label},
                         )
                         message = "Failed to write attendance. Check logs for details."
-                else:
-                    result = write_attendance_entries(
-                        sheet_id=sheet_id,
-                        tab_name=tab_name,
-                        header_row=attendance_data.get("header_row", 1),
-                        date_columns=copy.deepcopy(attendance_data.get("date_columns", [])),
-                        last_column_index=attendance_data.get("last_column_index", 1),
-                        target_iso=target_date,
-                        event_label=event_label,
-                        updates=updates,
-                        color_present=app.config.get("ATT_COLOR_PRESENT", "#00ff00"),
-                        color_ftr=app.config.get("ATT_COLOR_FTR", "#ff0000"),
-                        color_excused=app.config.get("ATT_COLOR_EXCUSED", "#ffff00"),
-                    )
-
-                    refresh_cache(app, "attendance")
-                    message = f"Updated {result.get('updated', 0)} cells for {target_date}."
 
             if status_summary:
                 status_summary = {
@@ -17,9 +17,10 @@ import os
 import pickle
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable, Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pytz
 
@@ -55,50 +56,7 @@ def _get_timezone(app):
 
 
 def _now_tz(app) -> datetime:
-    tz = _get_timezone(app)
-
-def _get_timezone(app):
-    tz_name = app.config.get("TZ", "America/Chicago")
-    try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        log.warning("Invalid timezone '%s'; defaulting to UTC", tz_name)
-        return pytz.UTC
-
-
-def _now_tz(app) -> datetime:
-    tz = _get_timezone(app)
-
-
-def _get_timezone(app):
-    tz_name = app.config.get("TZ", "America/Chicago")
-    try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        log.warning("Invalid timezone '%s'; defaulting to UTC", tz_name)
-        return pytz.UTC
-
-
-def _now_tz(app) -> datetime:
-    tz = _get_timezone(app)
-
-def _get_timezone(app):
-    tz_name = app.config.get("TZ", "America/Chicago")
-    try:
-        return pytz.timezone(tz_name)
-    except Exception:
-        log.warning("Invalid timezone '%s'; defaulting to UTC", tz_name)
-        return pytz.UTC
-
-
-def _now_tz(app) -> datetime:
-    tz = _get_timezone(app)
-
-
-def _now_tz(app) -> datetime:
-    tz_name = app.config.get("TZ", "America/Chicago")
-    tz = pytz.timezone(tz_name)
-    return datetime.now(tz)
+    return datetime.now(_get_timezone(app))
 
 
 def _should_refresh(app, cache_name: str) -> bool:
@@ -128,12 +86,6 @@ def _should_refresh(app, cache_name: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-
-# ---------------------------------------------------------------------------
-# Loader registry
-# ---------------------------------------------------------------------------
-
-
 def _load_attendance(app) -> Dict[str, Any]:
     from ..integrations.google_sheets_attendance import build_attendance_cache
 
@@ -152,38 +104,6 @@ def _load_attendance(app) -> Dict[str, Any]:
 def _load_availability(app) -> Dict[str, Any]:
     from ..integrations.google_sheets_attendance import build_availability_cache
 
-
-def _load_availability(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_availability_cache
-
-def _load_availability(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_availability_cache
-
-    url = app.config.get("AVAILABILITY_CSV_URL", "")
-    if not url:
-        log.info("Availability CSV URL not configured; returning empty dataset.")
-        return {"generated_at": _now_tz(app).isoformat(), "entries": [], "index": {}}
-
-    return build_availability_cache(
-        csv_url=url,
-        name_column_override=app.config.get("AVAILABILITY_NAME_COLUMN", ""),
-    )
-
-
-def _load_umr(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_umr_cache
-
-    sheet_id = app.config.get("SPREADSHEET_ID")
-    tab_name = app.config.get("UMR_TAB_NAME", "UMR")
-    if not sheet_id:
-        raise RuntimeError("SPREADSHEET_ID is not configured.")
-
-    return build_umr_cache(
-        sheet_id=sheet_id,
-        tab_name=tab_name,
-        mapping_json=app.config.get("UMR_MAPPING_JSON", ""),
-    )
-
     url = app.config.get("AVAILABILITY_CSV_URL", "")
     if not url:
         log.info("Availability CSV URL not configured; returning empty dataset.")
@@ -222,88 +142,48 @@ CACHE_LOADERS: Dict[str, Callable] = {
 # ---------------------------------------------------------------------------
 
 
-def refresh_cache(app, cache_name: str = "attendance") -> bool:
-    """Force refresh for a specific cache file."""
-
-    if cache_name not in CACHE_LOADERS:
-        raise KeyError(f"Unknown cache: {cache_name}")
-
-    loader = CACHE_LOADERS[cache_name]
-
-CACHE_LOADERS: Dict[str, Callable] = {
-    "attendance": _load_attendance,
-    "availability": _load_availability,
-    "umr": _load_umr,
-}
-
+# Decoded cache payloads kept in-process: path -> (loaded_at, data).  The
+# pickles only change on refresh, so re-reading them on every request is
+# wasted disk I/O and unpickling; entries expire after CACHE_MEMORY_TTL
+# seconds so refreshes made by other workers are still picked up.
+_MEMORY_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
-# ---------------------------------------------------------------------------
-# Public helpers
-# ---------------------------------------------------------------------------
+# One lock per cache so requests that find the same cache stale wait for a
+# single rebuild instead of each starting their own round of Google calls.
+_REFRESH_LOCKS: Dict[str, threading.Lock] = {name: threading.Lock() for name in CACHE_FILES}
 
 
-def refresh_cache(app, cache_name: str = "attendance") -> bool:
-    """Force refresh for a specific cache file."""
-
-    if cache_name not in CACHE_LOADERS:
-        raise KeyError(f"Unknown cache: {cache_name}")
-
-    loader = CACHE_LOADERS[cache_name]
-
-def _load_availability(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_availability_cache
-
-    url = app.config.get("AVAILABILITY_CSV_URL", "")
-    if not url:
-        log.info("Availability CSV URL not configured; returning empty dataset.")
-        return {"generated_at": _now_tz(app).isoformat(), "entries": [], "index": {}}
-
-    return build_availability_cache(
-        csv_url=url,
-        name_column_override=app.config.get("AVAILABILITY_NAME_COLUMN", ""),
-    )
-
-
-
-def _load_availability(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_availability_cache
-
-    url = app.config.get("AVAILABILITY_CSV_URL", "")
-    if not url:
-        log.info("Availability CSV URL not configured; returning empty dataset.")
-        return {"generated_at": _now_tz(app).isoformat(), "entries": [], "index": {}}
-
-    return build_availability_cache(
-        csv_url=url,
-        name_column_override=app.config.get("AVAILABILITY_NAME_COLUMN", ""),
-    )
-
-
-def _load_umr(app) -> Dict[str, Any]:
-    from ..integrations.google_sheets_attendance import build_umr_cache
+def _memory_ttl(app) -> float:
+    try:
+        return float(app.config.get("CACHE_MEMORY_TTL", 60))
+    except (TypeError, ValueError):
+        return 60.0
 
-    sheet_id = app.config.get("SPREADSHEET_ID")
-    tab_name = app.config.get("UMR_TAB_NAME", "UMR")
-    if not sheet_id:
-        raise RuntimeError("SPREADSHEET_ID is not configured.")
 
-    return build_umr_cache(
-        sheet_id=sheet_id,
-        tab_name=tab_name,
-        mapping_json=app.config.get("UMR_MAPPING_JSON", ""),
-    )
+def _remember(path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    _MEMORY_CACHE[path] = (time.monotonic(), data)
+    return data
 
 
-CACHE_LOADERS: Dict[str, Callable] = {
-    "attendance": _load_attendance,
-    "availability": _load_availability,
-    "umr": _load_umr,
-}
+def _write_snapshot(path: str, data: Dict[str, Any]) -> None:
+    """Atomically replace the pickle at ``path``.
 
+    The payload is written to a sibling temp file and swapped in with
+    os.replace, so a worker starting up (or another worker's TTL reload)
+    never unpickles a half-written file and falls back to a full refetch.
+    """
 
-# ---------------------------------------------------------------------------
-# Public helpers
-# ---------------------------------------------------------------------------
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def refresh_cache(app, cache_name: str = "attendance") -> bool:
@@ -317,8 +197,8 @@ def refresh_cache(app, cache_name: str = "attendance") -> bool:
     try:
         data = loader(app)
         path = _cache_path(app, cache_name)
-        with open(path, "wb") as fh:
-            pickle.dump(data, fh)
+        _write_snapshot(path, data)
+        _remember(path, data)
         app.logger.info("Cache refreshed for %s -> %s", cache_name, path)
         return True
     except Exception:
@@ -326,23 +206,90 @@ def refresh_cache(app, cache_name: str = "attendance") -> bool:
         return False
 
 
-def get_cached_data(app, cache_name: str = "attendance") -> Dict[str, Any]:
-    if cache_name not in CACHE_LOADERS:
-        raise KeyError(f"Unknown cache: {cache_name}")
+def _refresh_now(app, cache_name: str, path: str) -> Optional[Dict[str, Any]]:
+    """Rebuild a stale cache on the calling thread.
 
-    if _should_refresh(app, cache_name):
+    Returns the payload to serve, or ``None`` when the previous snapshot on
+    disk should be read instead.
+    """
+
+    with _REFRESH_LOCKS[cache_name]:
+        # Re-check under the lock: the request that held it before us
+        # has usually just rebuilt the cache, in which case we read it.
+        if not _should_refresh(app, cache_name):
+            return None
         app.logger.debug("Cache '%s' is stale; refreshing.", cache_name)
-        if not refresh_cache(app, cache_name):
+        if refresh_cache(app, cache_name):
+            return _MEMORY_CACHE[path][1]
+        if not os.path.exists(path):
             app.logger.error(
                 "Cache '%s' refresh failed; returning empty dataset.", cache_name
             )
             return {}
-        refresh_cache(app, cache_name)
+        # Yesterday's data beats an empty page.  The caller reads it from
+        # disk rather than reusing this worker's in-memory copy, which may be
+        # older than a pickle another worker has rewritten since; remembering
+        # it also spaces retries out by CACHE_MEMORY_TTL.
+        app.logger.warning(
+            "Cache '%s' refresh failed; serving previous snapshot.", cache_name
+        )
+        return None
+
+
+def _refresh_in_background(app, cache_name: str) -> None:
+    """Start a refresh thread unless one is already running for this cache."""
+
+    lock = _REFRESH_LOCKS[cache_name]
+    if not lock.acquire(blocking=False):
+        return
+
+    def _run():
+        try:
+            if _should_refresh(app, cache_name):
+                app.logger.debug("Cache '%s' is stale; refreshing in background.", cache_name)
+                refresh_cache(app, cache_name)
+        finally:
+            lock.release()
+
+    try:
+        threading.Thread(target=_run, name=f"cache-refresh-{cache_name}", daemon=True).start()
+    except Exception:
+        lock.release()
+        raise
+
+
+def get_cached_data(app, cache_name: str = "attendance", fresh: bool = False) -> Dict[str, Any]:
+    """Return the payload for ``cache_name``.
+
+    ``fresh=True`` skips the in-process copy and never serves a stale
+    snapshot: callers that write back to the sheet (the writer) need the
+    column layout another worker may have just changed.
+    """
+
+    if cache_name not in CACHE_LOADERS:
+        raise KeyError(f"Unknown cache: {cache_name}")
 
     path = _cache_path(app, cache_name)
+    hit = _MEMORY_CACHE.get(path)
+    if not fresh and hit is not None and time.monotonic() - hit[0] < _memory_ttl(app):
+        return hit[1]
+
+    if _should_refresh(app, cache_name):
+        if not fresh and app.config.get("CACHE_BACKGROUND_REFRESH", False) and (
+            hit is not None or os.path.exists(path)
+        ):
+            # A snapshot exists, so answer from it now and let one background
+            # thread pay for the Google round-trips.  It is read from disk
+            # below: another worker may have rewritten it since ``hit``.
+            _refresh_in_background(app, cache_name)
+        else:
+            data = _refresh_now(app, cache_name, path)
+            if data is not None:
+                return data
+
     try:
         with open(path, "rb") as fh:
-            return pickle.load(fh)
+            return _remember(path, pickle.load(fh))
     except FileNotFoundError:
         app.logger.warning("Cache %s missing on disk; regenerating.", cache_name)
         if not refresh_cache(app, cache_name):
@@ -350,18 +297,7 @@ def get_cached_data(app, cache_name: str = "attendance") -> Dict[str, Any]:
                 "Cache '%s' could not be created; returning empty dataset.", cache_name
             )
             return {}
-        try:
-            with open(path, "rb") as fh:
-                return pickle.load(fh)
-        except FileNotFoundError:
-            app.logger.error(
-                "Cache '%s' still missing after refresh; returning empty dataset.",
-                cache_name,
-            )
-            return {}
-        refresh_cache(app, cache_name)
-        with open(path, "rb") as fh:
-            return pickle.load(fh)
+        return _MEMORY_CACHE[path][1]
     except Exception:
         app.logger.exception("Error reading cache %s; returning empty dict", cache_name)
         return {}
@@ -394,12 +330,26 @@ def _scheduler_loop(app):
 
         time.sleep(sleep_seconds)
 
-        for cache_name in CACHE_LOADERS:
-            try:
-                app.logger.info("Running scheduled refresh for %s", cache_name)
-                refresh_cache(app, cache_name)
-            except Exception:
-                app.logger.exception("Scheduled cache refresh failed for %s", cache_name)
+        _refresh_all(app)
+
+
+def _refresh_all(app) -> None:
+    """Refresh every registered cache concurrently.
+
+    Each loader is dominated by network latency against Google, and none
+    depends on another, so they are fetched in parallel threads rather
+    than one after the other.
+    """
+
+    def _run(cache_name: str) -> None:
+        try:
+            app.logger.info("Running scheduled refresh for %s", cache_name)
+            refresh_cache(app, cache_name)
+        except Exception:
+            app.logger.exception("Scheduled cache refresh failed for %s", cache_name)
+
+    with ThreadPoolExecutor(max_workers=len(CACHE_LOADERS), thread_name_prefix="cache-refresh") as pool:
+        list(pool.map(_run, CACHE_LOADERS))
 
 
 def init_cache_scheduler(app):
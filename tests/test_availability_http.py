@@ -0,0 +1,48 @@
+"""Limits on the availability CSV fetch.
+
+Stale caches refresh on request threads, so one fetch (with its retries)
+has to finish inside gunicorn's default 30s worker timeout.
+"""
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("gspread")
+pytest.importorskip("requests")
+
+from urllib3.response import HTTPResponse  # noqa: E402
+
+from app.integrations import google_sheets_attendance as gsa  # noqa: E402
+
+GUNICORN_WORKER_TIMEOUT = 30  # Procfile runs gunicorn with default settings
+
+
+def _retry():
+    return gsa._http_session().get_adapter("https://docs.google.com/").max_retries
+
+
+def test_retry_limits():
+    retry = _retry()
+    assert isinstance(retry, gsa._BoundedRetry)
+    assert retry.total == gsa._CSV_RETRIES
+    assert retry.read == 0
+    assert set(retry.allowed_methods) == {"GET"}
+
+
+def test_worst_case_fits_worker_timeout():
+    connect, read = gsa._CSV_TIMEOUT
+    attempts = gsa._CSV_RETRIES + 1
+    worst = attempts * (connect + read) + gsa._CSV_RETRIES * gsa._CSV_RETRY_WAIT_MAX
+    assert worst < GUNICORN_WORKER_TIMEOUT
+
+
+def test_retry_after_is_capped():
+    response = HTTPResponse(status=429, headers={"Retry-After": "120"})
+    assert _retry().get_retry_after(response) == gsa._CSV_RETRY_WAIT_MAX
+
+
+def test_backoff_is_capped():
+    retry = gsa._BoundedRetry(total=10, backoff_factor=10, status_forcelist=(503,))
+    for _ in range(5):
+        retry = retry.increment(method="GET", url="/", response=HTTPResponse(status=503))
+    assert retry.get_backoff_time() == gsa._CSV_RETRY_WAIT_MAX